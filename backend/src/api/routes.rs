@@ -157,15 +157,19 @@ async fn mcp_handler(
 
     // Parse JSON-RPC request
     let json_str = serde_json::to_string(&request).map_err(|_| StatusCode::BAD_REQUEST)?;
-    let rpc_request = JsonRpcRequest::from_json(&json_str).map_err(|e| {
-        tracing::error!("Failed to parse JSON-RPC request: {}", e.message);
-        StatusCode::BAD_REQUEST
-    })?;
-
-    // Validate request
-    if let Err(e) = rpc_request.validate() {
-        tracing::error!("Invalid JSON-RPC request: {}", e.message);
-        return Err(StatusCode::BAD_REQUEST);
+
+    // Batches (JSON arrays) are validated per request by the MCP server
+    if !request.is_array() {
+        let rpc_request = JsonRpcRequest::from_json(&json_str).map_err(|e| {
+            tracing::error!("Failed to parse JSON-RPC request: {}", e.message);
+            StatusCode::BAD_REQUEST
+        })?;
+
+        // Validate request
+        if let Err(e) = rpc_request.validate() {
+            tracing::error!("Invalid JSON-RPC request: {}", e.message);
+            return Err(StatusCode::BAD_REQUEST);
+        }
     }
 
     // Create temporary MCP server (it's stateless except for the game manager)
@@ -180,10 +184,18 @@ async fn mcp_handler(
     let response: serde_json::Value =
         serde_json::from_str(&response_str).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
-    // If the MCP call was successful, update last_mcp_activity and broadcast
-    if let Some(result) = response.get("result")
-        && !result.is_null()
-    {
+    // If any MCP call was successful, update last_mcp_activity and broadcast
+    let succeeded = |response: &serde_json::Value| {
+        response
+            .get("result")
+            .is_some_and(|result| !result.is_null())
+    };
+    let any_succeeded = match &response {
+        serde_json::Value::Array(responses) => responses.iter().any(succeeded),
+        single => succeeded(single),
+    };
+
+    if any_succeeded {
         let timestamp = std::time::SystemTime::now()
             .duration_since(std::time::UNIX_EPOCH)
             .unwrap()
@@ -220,4 +232,79 @@ pub fn create_router(state: AppState) -> Router {
         .with_state(state)
 }
 
-// Unit tests removed - see api_integration.rs for comprehensive API tests via actual HTTP requests
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Serve the router on an ephemeral port, returning its base URL and state
+    async fn spawn_server() -> (String, AppState) {
+        let manager = GameManager::new(":memory:").expect("Failed to create manager");
+        let (sse_tx, _) = broadcast::channel(100);
+        let state = AppState {
+            game_manager: Arc::new(Mutex::new(manager)),
+            sse_tx,
+        };
+
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0")
+            .await
+            .expect("Failed to bind listener");
+        let addr = listener.local_addr().unwrap();
+        let app = create_router(state.clone());
+        tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+
+        (format!("http://{}", addr), state)
+    }
+
+    /// POST a JSON-RPC payload to /mcp and return the parsed response body
+    async fn post_mcp(url: &str, payload: serde_json::Value) -> serde_json::Value {
+        let response = reqwest::Client::new()
+            .post(format!("{}/mcp", url))
+            .json(&payload)
+            .send()
+            .await
+            .expect("Failed to send request");
+        assert_eq!(response.status(), reqwest::StatusCode::OK);
+        response.json().await.expect("Failed to parse response")
+    }
+
+    #[tokio::test]
+    async fn test_mcp_batch_over_http() {
+        let (url, state) = spawn_server().await;
+        let mut events = state.sse_tx.subscribe();
+
+        // The second element would be rejected with 400 on its own
+        let body = post_mcp(
+            &url,
+            json!([
+                {"jsonrpc": "2.0", "method": "view_game_state", "params": {}, "id": 1},
+                {"jsonrpc": "1.0", "method": "get_turn", "params": {}, "id": 2}
+            ]),
+        )
+        .await;
+
+        let responses = body.as_array().expect("Batch response should be an array");
+        assert_eq!(responses.len(), 2);
+        assert!(responses[0]["result"]["board"].is_array());
+        assert!(responses[1].get("error").is_some());
+
+        // One successful call in the batch is enough to broadcast
+        assert!(events.try_recv().is_ok());
+    }
+
+    #[tokio::test]
+    async fn test_mcp_failed_batch_does_not_broadcast() {
+        let (url, state) = spawn_server().await;
+        let mut events = state.sse_tx.subscribe();
+
+        let body = post_mcp(
+            &url,
+            json!([{"jsonrpc": "2.0", "method": "no_such_tool", "params": {}, "id": 1}]),
+        )
+        .await;
+
+        let responses = body.as_array().expect("Batch response should be an array");
+        assert_eq!(responses.len(), 1);
+        assert!(responses[0].get("error").is_some());
+        assert!(events.try_recv().is_err());
+    }
+}
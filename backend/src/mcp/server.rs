@@ -56,33 +56,63 @@ impl<'a> McpServer<'a> {
         Ok(())
     }
 
-    /// Handle a single JSON-RPC request
+    /// Handle a single JSON-RPC request or a batch of requests
     pub fn handle_request(&mut self, json: &str) -> String {
-        // Parse the request
-        let request = match JsonRpcRequest::from_json(json) {
-            Ok(req) => req,
+        // A JSON array is a JSON-RPC 2.0 batch, answered with an array of responses
+        if json.trim_start().starts_with('[') {
+            return self.handle_batch(json);
+        }
+
+        self.respond(JsonRpcRequest::from_json(json)).to_json()
+    }
+
+    /// Handle a JSON-RPC 2.0 batch, processing requests in order
+    fn handle_batch(&mut self, json: &str) -> String {
+        let requests: Vec<Value> = match serde_json::from_str(json) {
+            Ok(requests) => requests,
             Err(e) => {
-                let response = JsonRpcResponse::error(Value::Null, e);
-                return response.to_json();
+                let error = JsonRpcError::parse_error(format!("Parse error: {}", e));
+                return JsonRpcResponse::error(Value::Null, error).to_json();
             }
         };
 
+        if requests.is_empty() {
+            let error = JsonRpcError::invalid_request("Batch cannot be empty".to_string());
+            return JsonRpcResponse::error(Value::Null, error).to_json();
+        }
+
+        let responses: Vec<JsonRpcResponse> = requests
+            .into_iter()
+            .map(|value| {
+                let request = serde_json::from_value(value)
+                    .map_err(|e| JsonRpcError::invalid_request(format!("Invalid request: {}", e)));
+                self.respond(request)
+            })
+            .collect();
+
+        serde_json::to_string(&responses).unwrap()
+    }
+
+    /// Validate and dispatch a parsed request, producing its response
+    fn respond(&mut self, request: Result<JsonRpcRequest, JsonRpcError>) -> JsonRpcResponse {
+        let request = match request {
+            Ok(req) => req,
+            Err(e) => return JsonRpcResponse::error(Value::Null, e),
+        };
+
         // Validate the request
         if let Err(e) = request.validate() {
-            let response = JsonRpcResponse::error(request.id.clone(), e);
-            return response.to_json();
+            return JsonRpcResponse::error(request.id.clone(), e);
         }
 
         // Dispatch to the appropriate tool
         let result = self.dispatch(&request.method, request.params.clone());
 
         // Create response
-        let response = match result {
+        match result {
             Ok(value) => JsonRpcResponse::success(request.id, value),
             Err(error) => JsonRpcResponse::error(request.id, error),
-        };
-
-        response.to_json()
+        }
     }
 
     /// Dispatch a method call to the appropriate tool handler
@@ -336,4 +366,52 @@ mod tests {
         let resp3 = server.handle_request(req3);
         assert!(resp3.contains(r#""id":3"#));
     }
+
+    #[test]
+    fn test_handle_batch_request() {
+        let mut server = create_test_server();
+        let request = r#"[
+            {"jsonrpc":"2.0","id":0,"method":"make_move","params":{"row":0,"col":0}},
+            {"jsonrpc":"2.0","id":1,"method":"get_turn","params":{}}
+        ]"#;
+
+        let response = server.handle_request(request);
+        let responses: Vec<Value> = serde_json::from_str(&response).unwrap();
+
+        assert_eq!(responses.len(), 2);
+        assert_eq!(responses[0]["id"], 0);
+        assert_eq!(responses[0]["result"]["success"], true);
+        // Requests run in order, so get_turn sees the move
+        assert_eq!(responses[1]["id"], 1);
+        assert_eq!(
+            responses[1]["result"]["currentTurn"],
+            responses[0]["result"]["gameState"]["currentTurn"]
+        );
+    }
+
+    #[test]
+    fn test_handle_batch_with_error() {
+        let mut server = create_test_server();
+        let request = r#"[
+            {"jsonrpc":"2.0","id":0,"method":"unknown_method","params":{}},
+            {"jsonrpc":"2.0","id":1,"method":"get_turn","params":{}}
+        ]"#;
+
+        let response = server.handle_request(request);
+        let responses: Vec<Value> = serde_json::from_str(&response).unwrap();
+
+        assert_eq!(responses.len(), 2);
+        assert_eq!(responses[0]["error"]["code"], -32601); // METHOD_NOT_FOUND
+        assert!(responses[1].get("result").is_some());
+    }
+
+    #[test]
+    fn test_handle_empty_batch() {
+        let mut server = create_test_server();
+
+        let response = server.handle_request("[]");
+
+        assert!(response.contains(r#""error""#));
+        assert!(response.contains(r#""code":-32600"#)); // INVALID_REQUEST
+    }
 }
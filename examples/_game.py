@@ -0,0 +1,77 @@
+"""
+Tic-tac-toe solver and board prompt shared by the example agents.
+
+The game is solved locally with minimax, so the model just picks among the
+optimal moves and writes the taunt instead of reasoning about strategy.
+"""
+
+import functools
+
+# Answer to any make_move after the first in one model turn. The server places the
+# mark of whoever is to move, so a second call would play the opponent's mark.
+EXTRA_MOVE_RESULT = {"error": "Only one make_move per turn is allowed; this one was not played."}
+
+def _board_string(view_result):
+    """Flatten the board to 9 row-major characters (index i is row i // 3, col i % 3), "." if empty."""
+    return "".join(
+        cell["Occupied"] if isinstance(cell, dict) else "."
+        for row in view_result["board"]
+        for cell in row
+    )
+
+def compact_state(view_result):
+    """Flatten a view_game_state result into a 9-character board and one status line."""
+    return (
+        f"board={_board_string(view_result)} turn={view_result['currentTurn']} "
+        f"status={view_result['status']} ai={view_result['aiPlayer']}"
+    )
+
+_LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6))
+
+def _winner(board):
+    for a, b, c in _LINES:
+        if board[a] != "." and board[a] == board[b] == board[c]:
+            return board[a]
+    return None
+
+@functools.lru_cache(maxsize=None)
+def minimax(board, player):
+    """Solve ``board`` (a 9-character board string) with ``player`` to move.
+
+    Returns ``(best_score, best_moves)``: the score under optimal play and every
+    board index that achieves it. A draw scores 0; a win scores ``10 - marks``
+    and a loss ``marks - 10``, where ``marks`` is the number of marks on the
+    final board, so faster wins and slower losses rank higher.
+    """
+    empty = [i for i, cell in enumerate(board) if cell == "."]
+    winner = _winner(board)
+    if winner is not None:
+        score = 1 + len(empty)
+        return (score if winner == player else -score), ()
+    if not empty:
+        return 0, ()
+
+    opponent = "O" if player == "X" else "X"
+    best_score, best_moves = -10, []
+    for i in empty:
+        score = -minimax(board[:i] + player + board[i + 1:], opponent)[0]
+        if score > best_score:
+            best_score, best_moves = score, [i]
+        elif score == best_score:
+            best_moves.append(i)
+    return best_score, tuple(best_moves)
+
+def state_prompt(mcp, side=None):
+    """Fetch the board through ``mcp`` and, on ``side``'s move, offer only optimal moves.
+
+    ``side`` defaults to the server's AI player.
+    """
+    state = mcp.call("view_game_state")
+    prompt = f"Current board:\n{compact_state(state)}"
+
+    our_side = side or state["aiPlayer"]
+    if state["status"] == "InProgress" and state["currentTurn"] == our_side:
+        _, moves = minimax(_board_string(state), our_side)
+        choices = ", ".join(f"(row {i // 3}, col {i % 3})" for i in moves)
+        prompt += f"\nChoose one of these equally strong moves: {choices}. Play it with make_move, then taunt."
+    return prompt
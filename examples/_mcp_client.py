@@ -0,0 +1,278 @@
+"""
+Shared MCP HTTP client for the example agents.
+
+Both agents talk to the server through ``MCPClient``, so connection pooling,
+batching, serialization, timeouts, retries and the read cache live in one place.
+
+Usage:
+    from _mcp_client import MCPClient
+    _MCP = MCPClient("http://localhost:7397/mcp")
+    _MCP.call("view_game_state")
+"""
+
+import msgspec
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import json
+import os
+import threading
+from typing import Any, List, Optional, Union
+
+# Pretty-printing every MCP result walks the whole structure, so it is opt-in
+VERBOSE = os.environ.get("MCP_AGENT_VERBOSE") == "1"
+
+# A single worker runs MCP calls in the order the model emitted them while the
+# response is still streaming; agents in one process share it like the client
+DISPATCHER = ThreadPoolExecutor(max_workers=1)
+atexit.register(DISPATCHER.shutdown)
+
+# Transport failures left after retries; reported to the model instead of crashing
+MCP_UNAVAILABLE = (urllib3.exceptions.MaxRetryError, urllib3.exceptions.TimeoutError)
+
+class MCPError(Exception):
+    """The MCP server answered with an HTTP error or a JSON-RPC error."""
+
+# Request bodies are pre-serialized with msgspec, so the headers are built once here
+_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+_TERMINAL_STATUSES = {"Won_X", "Won_O", "Draw"}
+
+# Idempotent reads are cached until the next call that can change their result
+_READ_METHODS = {"view_game_state", "get_turn"}
+_WRITE_METHODS = {"make_move", "restart_game", "taunt_player"}
+
+# JSON-RPC envelopes have a fixed shape, so msgspec can encode and validate them
+class RpcRequest(msgspec.Struct):
+    """JSON-RPC 2.0 request."""
+    method: str
+    params: dict = {}
+    id: int = 1
+    jsonrpc: str = "2.0"
+
+class RpcResponse(msgspec.Struct):
+    """JSON-RPC 2.0 response; exactly one of result or error is set."""
+    id: Optional[int] = None
+    result: Any = None
+    error: Optional[dict] = None
+
+_ENCODER = msgspec.json.Encoder()
+_RESPONSE_DECODER = msgspec.json.Decoder(RpcResponse)
+# A rejected batch comes back as a single error response instead of a list
+_BATCH_DECODER = msgspec.json.Decoder(Union[List[RpcResponse], RpcResponse])
+
+# Tool schemas in JSON Schema form; each agent wraps them for its provider
+TOOL_SCHEMAS = [
+    {
+        "name": "make_move",
+        "description": "Make a move on the tic-tac-toe board",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "row": {
+                    "type": "integer",
+                    "description": "Row index (0-2)",
+                    "minimum": 0,
+                    "maximum": 2
+                },
+                "col": {
+                    "type": "integer",
+                    "description": "Column index (0-2)",
+                    "minimum": 0,
+                    "maximum": 2
+                }
+            },
+            "required": ["row", "col"]
+        }
+    },
+    {
+        "name": "taunt_player",
+        "description": "Send a trash talk message to your opponent",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "The taunt message to send"
+                }
+            },
+            "required": ["message"]
+        }
+    }
+]
+
+class MCPClient:
+    """JSON-RPC client for the MCP HTTP server, shared by every agent in the process.
+
+    There is one instance per URL, so agents running in the same process reuse
+    one connection pool and one read cache. Writes from any agent go through the
+    same instance and invalidate the cache for all of them.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, url):
+        with cls._instances_lock:
+            client = cls._instances.get(url)
+            if client is None:
+                client = super().__new__(cls)
+                client._connect(url)
+                cls._instances[url] = client
+            return client
+
+    def _connect(self, url):
+        # Connection pool bound to the MCP host, so every call reuses the same
+        # keep-alive connection and skips per-call URL parsing and pool lookup
+        self._http = urllib3.connection_from_url(
+            url,
+            maxsize=16,
+            block=False,
+            timeout=urllib3.Timeout(connect=3.05, read=30),
+            # Read errors are not retried: a make_move may already have been applied
+            retries=urllib3.Retry(
+                total=3,
+                connect=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["POST"])
+            )
+        )
+        atexit.register(self._http.close)
+        self._path = urllib3.util.parse_url(url).request_uri
+
+        # Calls are serialized so a read cannot be cached after a concurrent write
+        self._lock = threading.Lock()
+        self._read_cache = {}
+
+        # Set once the server reports a finished game; restart_game clears it
+        self.game_over = False
+
+    def _post(self, body):
+        response = self._http.urlopen("POST", self._path, body=body, headers=_HEADERS)
+        if response.status >= 400:
+            raise MCPError(f"MCP HTTP Error: {response.status}")
+        return response.data
+
+    def _post_one(self, method, params):
+        """Call an MCP tool via HTTP."""
+        data = self._post(_ENCODER.encode(RpcRequest(method=method, params=params or {})))
+        result = _RESPONSE_DECODER.decode(data)
+        if result.error is not None:
+            raise MCPError(f"MCP Error: {result.error}")
+        return result.result if result.result is not None else {}
+
+    def _post_batch(self, calls):
+        """Call several MCP tools in one HTTP request using a JSON-RPC 2.0 batch.
+
+        A call the server rejected comes back as an ``MCPError`` in its slot.
+        """
+        payload = [
+            RpcRequest(method=method, params=params or {}, id=i)
+            for i, (method, params) in enumerate(calls)
+        ]
+        responses = _BATCH_DECODER.decode(self._post(_ENCODER.encode(payload)))
+        if isinstance(responses, RpcResponse):
+            # The batch as a whole was rejected
+            raise MCPError(f"MCP Error: {responses.error}")
+
+        # Responses may arrive in any order; each id is the index of its call
+        results = [None] * len(calls)
+        for response in responses:
+            if response.id is None:
+                # The server could not parse an element, so it cannot say which one
+                raise MCPError(f"MCP Error: {response.error}")
+            if response.error is not None:
+                results[response.id] = MCPError(f"MCP Error: {response.error}")
+            else:
+                results[response.id] = response.result if response.result is not None else {}
+        return results
+
+    def _record(self, method, result):
+        """Track the end of the game from the server's authoritative status.
+
+        A fresh view_game_state also catches games the opponent finished.
+        """
+        if method == "restart_game":
+            self.game_over = False
+        elif method == "make_move" and result.get("gameState", {}).get("status") in _TERMINAL_STATUSES:
+            self.game_over = True
+        elif method == "view_game_state" and result.get("status") in _TERMINAL_STATUSES:
+            self.game_over = True
+
+    def call(self, method, params=None):
+        """Call an MCP tool, serving repeated reads from the read cache."""
+        key = _cache_key(method, params)
+        with self._lock:
+            if key in self._read_cache:
+                return self._read_cache[key]
+            if method in _WRITE_METHODS:
+                self._read_cache.clear()
+
+            result = self._post_one(method, params)
+            self._record(method, result)
+            if _is_cacheable(method, result):
+                self._read_cache[key] = result
+            return result
+
+    def batch(self, calls):
+        """Call several MCP tools in one HTTP request using a JSON-RPC 2.0 batch.
+
+        ``calls`` is a list of ``(method, params)`` pairs. Cached reads are
+        answered locally and left out of the request. Results are returned in
+        the same order as ``calls``; a call the server rejected gets an
+        ``MCPError`` in its slot instead of raising, so the results of the
+        calls that did run are not lost.
+        """
+        results = [None] * len(calls)
+        pending = []
+
+        with self._lock:
+            # Reads after a write in the same batch must see the write, so go to the server
+            if any(method in _WRITE_METHODS for method, _ in calls):
+                self._read_cache.clear()
+            for i, (method, params) in enumerate(calls):
+                key = _cache_key(method, params)
+                if key in self._read_cache:
+                    results[i] = self._read_cache[key]
+                else:
+                    pending.append(i)
+
+            if pending:
+                posted = self._post_batch([calls[i] for i in pending])
+                for i, result in zip(pending, posted):
+                    results[i] = result
+                    if not isinstance(result, MCPError):
+                        self._record(calls[i][0], result)
+
+                # Only reads after the last write in the batch reflect the final state
+                writes = [i for i in pending if calls[i][0] in _WRITE_METHODS]
+                last_write = writes[-1] if writes else -1
+                for i in pending:
+                    method, params = calls[i]
+                    if isinstance(results[i], MCPError):
+                        continue
+                    if i > last_write and _is_cacheable(method, results[i]):
+                        self._read_cache[_cache_key(method, params)] = results[i]
+        return results
+
+def _cache_key(method, params):
+    return (method, frozenset((params or {}).items()))
+
+def _is_cacheable(method, result):
+    """Only cache reads taken on the AI's move; the human cannot change the board then."""
+    if method not in _READ_METHODS:
+        return False
+    if result.get("status", "InProgress") != "InProgress":
+        return False
+    if "isAiTurn" in result:
+        return result["isAiTurn"]
+    return result.get("currentTurn") == result.get("aiPlayer")
+
+def print_result(function_name, result):
+    """Report an MCP result; the full payload only when MCP_AGENT_VERBOSE=1."""
+    if VERBOSE:
+        print(f"✅ Result: {json.dumps(result, indent=2)}")
+    else:
+        print(f"✅ {function_name} ok")
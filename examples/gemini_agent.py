@@ -8,105 +8,90 @@ Usage:
 """
 
 import google.generativeai as genai
-import requests
-import json
 import os
 
+from _game import EXTRA_MOVE_RESULT, state_prompt
+from _mcp_client import DISPATCHER, MCP_UNAVAILABLE, TOOL_SCHEMAS, VERBOSE, MCPClient, MCPError, print_result
+
 # MCP server endpoint
 MCP_URL = "http://localhost:7397/mcp"
 
-def call_mcp_tool(method, params=None):
-    """Call an MCP tool via HTTP."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": method,
-        "params": params or {},
-        "id": 1
+# Shared client: pooled connection, batching, timeouts, retries and read cache
+_MCP = MCPClient(MCP_URL)
+
+def _gemini_declaration(schema):
+    """Adapt a shared tool schema to Gemini, whose Schema has no minimum/maximum."""
+    parameters = schema["parameters"]
+    properties = {
+        name: {key: value for key, value in prop.items() if key not in ("minimum", "maximum")}
+        for name, prop in parameters["properties"].items()
     }
-    response = requests.post(MCP_URL, json=payload)
-    result = response.json()
-    if "error" in result:
-        raise Exception(f"MCP Error: {result['error']}")
-    return result.get("result", {})
-
-# Define Gemini function declarations
-function_declarations = [
-    {
-        "name": "view_game_state",
-        "description": "View the current tic-tac-toe game state including board, turn, status, and move history",
-        "parameters": {
-            "type": "object",
-            "properties": {}
-        }
-    },
-    {
-        "name": "get_turn",
-        "description": "Get whose turn it is (X or O)",
-        "parameters": {
-            "type": "object",
-            "properties": {}
-        }
-    },
-    {
-        "name": "make_move",
-        "description": "Make a move on the tic-tac-toe board",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "row": {
-                    "type": "integer",
-                    "description": "Row index (0-2)"
-                },
-                "col": {
-                    "type": "integer",
-                    "description": "Column index (0-2)"
-                }
-            },
-            "required": ["row", "col"]
-        }
-    },
-    {
-        "name": "taunt_player",
-        "description": "Send a trash talk message to your opponent",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "The taunt message to send"
-                }
-            },
-            "required": ["message"]
-        }
-    },
-    {
-        "name": "restart_game",
-        "description": "Restart the game with a fresh board",
-        "parameters": {
-            "type": "object",
-            "properties": {}
-        }
+    return {**schema, "parameters": {**parameters, "properties": properties}}
+
+# Convert the shared schemas to the protobuf Tool once instead of per request
+GEMINI_TOOLS = genai.types.Tool(
+    function_declarations=[_gemini_declaration(schema) for schema in TOOL_SCHEMAS]
+).to_proto()
+
+def _call_arguments(function_call):
+    """Gemini returns every number as a float, but the server wants integer rows and columns."""
+    return {
+        name: int(value) if isinstance(value, float) and value.is_integer() else value
+        for name, value in function_call.args.items()
     }
-]
 
-def execute_function_call(function_call):
-    """Execute a function call by calling the MCP server."""
-    function_name = function_call.name
-    arguments = dict(function_call.args)
+def execute_function_calls(function_calls, move_played=False):
+    """Execute a group of function calls in a single MCP request.
+
+    Only the first make_move of a model turn is played; ``move_played`` says an
+    earlier group of the same turn already had one. Skipped calls are answered
+    with EXTRA_MOVE_RESULT without reaching the server.
+    """
+    calls = [(function_call.name, _call_arguments(function_call)) for function_call in function_calls]
+
+    sent = []
+    for i, (function_name, arguments) in enumerate(calls):
+        print(f"\n🎮 Calling {function_name} with args: {arguments}")
+        if function_name == "make_move":
+            if move_played:
+                print(f"⚠️ make_move skipped: {EXTRA_MOVE_RESULT['error']}")
+                continue
+            move_played = True
+        sent.append(i)
 
-    print(f"\n🎮 Calling {function_name} with args: {arguments}")
-    result = call_mcp_tool(function_name, arguments)
-    print(f"✅ Result: {json.dumps(result, indent=2)}")
-    return result
-
-def run_agent():
-    """Run the Gemini agent to play tic-tac-toe."""
+    try:
+        posted = _MCP.batch([calls[i] for i in sent])
+    except MCP_UNAVAILABLE as e:
+        print(f"⚠️ MCP request failed: {e}")
+        posted = [{"error": f"MCP server unavailable: {e}"} for _ in sent]
+    except MCPError as e:
+        print(f"⚠️ MCP request failed: {e}")
+        posted = [{"error": str(e)} for _ in sent]
+
+    # Rejected calls (e.g. an occupied cell) go back to the model to react to
+    results = [EXTRA_MOVE_RESULT] * len(calls)
+    for i, result in zip(sent, posted):
+        function_name = calls[i][0]
+        if isinstance(result, MCPError):
+            print(f"⚠️ {function_name} failed: {result}")
+            result = {"error": str(result)}
+        elif "error" not in result:
+            print_result(function_name, result)
+        results[i] = result
+    return results
+
+def run_agent(side=None, turns=None):
+    """Run the Gemini agent to play tic-tac-toe.
+
+    For head-to-head games, ``side`` fixes the mark the agent plays and
+    ``turns`` is the turn signal the agent blocks on until it is its move.
+    """
     genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
 
     # Create model with function calling enabled
     model = genai.GenerativeModel(
         'gemini-pro',
-        tools=function_declarations
+        tools=[GEMINI_TOOLS]
     )
 
     chat = model.start_chat(enable_automatic_function_calling=False)
@@ -115,47 +100,95 @@ def run_agent():
     print("=" * 60)
 
     # Initial prompt
-    prompt = (
+    note = (
         "Let's play tic-tac-toe! You are a competitive player who loves trash talk. "
-        "First, check the game state, then make a strategic move, then send a taunt. "
+        "Each message shows the current board and, on your move, the optimal moves: "
+        "play one of them with make_move, then send a taunt. "
+        "Boards are compact: 9 characters in row-major order "
+        "(index i is row i // 3, col i % 3) and '.' marks an empty cell. "
         "Keep playing until the game is over."
     )
+    if side is not None:
+        note += f" You are playing {side}; only move when it is {side}'s turn."
 
-    print(f"\n💬 User: {prompt}")
+    print(f"\n💬 User: {note}")
+
+    # The previous turn's function responses, sent along with the next board
+    function_responses = []
 
     # Allow up to 15 turns
     for turn in range(15):
-        print(f"\n--- Turn {turn + 1} ---")
+        if turns is not None:
+            # Block until the opponent hands over the turn instead of polling get_turn
+            turns.wait(side)
+            if turns.finished:
+                break
 
-        response = chat.send_message(prompt)
+        print(f"\n--- Turn {turn + 1} ---")
 
-        # Check for function calls
-        if response.candidates[0].content.parts:
-            part = response.candidates[0].content.parts[0]
+        # Fetch the board only now that it is our move, so the model never sees a
+        # position from before the opponent's reply
+        state = state_prompt(_MCP, side)
+        if _MCP.game_over:
+            # The opponent finished the game; no need for another LLM round trip
+            print("\n🏁 Game over!")
+            break
+        text = f"{note}\n\n{state}" if note else state
+
+        # Built fresh each turn: ChatSession keeps sent Content in its history by
+        # reference, so mutating a shared template would rewrite earlier turns.
+        message = genai.protos.Content(parts=[*function_responses, genai.protos.Part(text=text)])
+        note, function_responses = None, []
+
+        response = chat.send_message(message, stream=True)
+
+        # Dispatch function calls as their chunks arrive, while Gemini keeps generating
+        function_calls = []
+        futures = []
+        for chunk in response:
+            if not chunk.candidates:
+                continue
+            calls = [p.function_call for p in chunk.candidates[0].content.parts if p.function_call.name]
+            if calls:
+                move_played = any(fc.name == "make_move" for fc in function_calls)
+                function_calls.extend(calls)
+                futures.append(DISPATCHER.submit(execute_function_calls, calls, move_played))
+
+        # Check for function calls (the streamed response now holds every part)
+        parts = response.candidates[0].content.parts
+        if parts:
+            # Every Part has both fields (the unused one is empty), so test their values
+            part = parts[0]
+
+            if function_calls:
+                results = [result for future in futures for result in future.result()]
+                if _MCP.game_over:
+                    print("\n🏁 Game over!")
+                    break
 
-            if hasattr(part, 'function_call'):
-                function_call = part.function_call
-                result = execute_function_call(function_call)
+                # A successful move passes the turn to the opponent
+                moved = any(
+                    fc.name == "make_move" and result.get("success")
+                    for fc, result in zip(function_calls, results)
+                )
+                if turns is not None and moved:
+                    turns.hand_over(side)
 
-                # Send function response back
-                prompt = genai.protos.Content(
-                    parts=[genai.protos.Part(
+                # Answer every function call in the next message
+                function_responses = [
+                    genai.protos.Part(
                         function_response=genai.protos.FunctionResponse(
                             name=function_call.name,
                             response={'result': result}
                         )
-                    )]
-                )
+                    )
+                    for function_call, result in zip(function_calls, results)
+                ]
 
-            elif hasattr(part, 'text'):
+            elif part.text:
                 # Model responded with text
                 print(f"\n💬 Gemini says: {part.text}")
-
-                # Check if game is over
-                if any(word in part.text.lower() for word in ['game over', 'won', 'draw', 'tie']):
-                    break
-
-                prompt = "Continue playing."
+                note = "Continue playing."
 
         else:
             print("\n✅ No more actions from Gemini")
@@ -177,5 +210,6 @@ if __name__ == "__main__":
         print("\n\n👋 Game interrupted by user")
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-OpenAI GPT-4 agent that plays tic-tac-toe using the MCP HTTP server.
+OpenAI GPT-4o agent that plays tic-tac-toe using the MCP HTTP server.
 
 Usage:
     export OPENAI_API_KEY="your-api-key-here"
@@ -8,103 +8,60 @@ Usage:
 """
 
 import openai
-import requests
-import json
+import msgspec
+from concurrent.futures import Future
 import os
 
+from _game import EXTRA_MOVE_RESULT, state_prompt
+from _mcp_client import DISPATCHER, MCP_UNAVAILABLE, TOOL_SCHEMAS, MCPClient, MCPError, print_result
+
 # MCP server endpoint
 MCP_URL = "http://localhost:7397/mcp"
 
-def call_mcp_tool(method, params=None):
-    """Call an MCP tool via HTTP."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": method,
-        "params": params or {},
-        "id": 1
-    }
-    response = requests.post(MCP_URL, json=payload)
-    result = response.json()
-    if "error" in result:
-        raise Exception(f"MCP Error: {result['error']}")
-    return result.get("result", {})
-
-# Define OpenAI function definitions
-functions = [
-    {
-        "name": "view_game_state",
-        "description": "View the current tic-tac-toe game state including board, turn, status, and move history",
-        "parameters": {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
-    },
-    {
-        "name": "get_turn",
-        "description": "Get whose turn it is (X or O)",
-        "parameters": {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
-    },
-    {
-        "name": "make_move",
-        "description": "Make a move on the tic-tac-toe board",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "row": {
-                    "type": "integer",
-                    "description": "Row index (0-2)",
-                    "minimum": 0,
-                    "maximum": 2
-                },
-                "col": {
-                    "type": "integer",
-                    "description": "Column index (0-2)",
-                    "minimum": 0,
-                    "maximum": 2
-                }
-            },
-            "required": ["row", "col"]
-        }
-    },
-    {
-        "name": "taunt_player",
-        "description": "Send a trash talk message to your opponent",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "The taunt message to send"
-                }
-            },
-            "required": ["message"]
-        }
-    },
-    {
-        "name": "restart_game",
-        "description": "Restart the game with a fresh board",
-        "parameters": {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
-    }
-]
+# Shared client: pooled connection, batching, timeouts, retries and read cache
+_MCP = MCPClient(MCP_URL)
+
+# Wrap the shared schemas in the tools format once instead of on every request
+TOOLS = [{"type": "function", "function": schema} for schema in TOOL_SCHEMAS]
 
 def execute_function(function_name, arguments):
     """Execute a function call by calling the MCP server."""
     print(f"\n🎮 Calling {function_name} with args: {arguments}")
-    result = call_mcp_tool(function_name, arguments)
-    print(f"✅ Result: {json.dumps(result, indent=2)}")
+    try:
+        result = _MCP.call(function_name, arguments)
+    except MCP_UNAVAILABLE as e:
+        print(f"⚠️ {function_name} failed: {e}")
+        return {"error": f"MCP server unavailable: {e}"}
+    except MCPError as e:
+        # Rejected calls (e.g. an occupied cell) go back to the model to react to
+        print(f"⚠️ {function_name} failed: {e}")
+        return {"error": str(e)}
+    print_result(function_name, result)
     return result
 
-def run_agent():
-    """Run the OpenAI agent to play tic-tac-toe."""
+def dispatch_tool_call(tool_calls):
+    """Queue the latest fully streamed tool call on the MCP worker and return its future.
+
+    Only the first make_move of a model turn is played; a later one is answered
+    with EXTRA_MOVE_RESULT without reaching the server.
+    """
+    function = tool_calls[-1]["function"]
+    if function["name"] == "make_move" and any(
+        tc["function"]["name"] == "make_move" for tc in tool_calls[:-1]
+    ):
+        print(f"\n⚠️ make_move skipped: {EXTRA_MOVE_RESULT['error']}")
+        future = Future()
+        future.set_result(EXTRA_MOVE_RESULT)
+        return future
+    arguments = msgspec.json.decode(function["arguments"])
+    return DISPATCHER.submit(execute_function, function["name"], arguments)
+
+def run_agent(side=None, turns=None):
+    """Run the OpenAI agent to play tic-tac-toe.
+
+    For head-to-head games, ``side`` fixes the mark the agent plays and
+    ``turns`` is the turn signal the agent blocks on until it is its move.
+    """
     client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
     messages = [
@@ -112,7 +69,10 @@ def run_agent():
             "role": "system",
             "content": "You are a competitive tic-tac-toe player who loves trash talk. "
                       "Play strategically and taunt your opponent with creative messages. "
-                      "Always check the game state first, then make your move, then taunt."
+                      "You are shown the current board before each turn. On your move you also get "
+                      "the optimal moves: play one of them with make_move, then taunt. "
+                      "Boards are compact: 9 characters in row-major order "
+                      "(index i is row i // 3, col i % 3) and '.' marks an empty cell."
         },
         {
             "role": "user",
@@ -120,50 +80,108 @@ def run_agent():
         }
     ]
 
+    if side is not None:
+        messages[0]["content"] += f" You are playing {side}; only move when it is {side}'s turn."
+
     print("🤖 Starting OpenAI agent...")
     print("=" * 60)
 
+    # The latest injected board; replaced each turn so only one copy is re-encoded
+    state_message = None
+
     # Allow up to 10 function calls
     for turn in range(10):
+        if turns is not None:
+            # Block until the opponent hands over the turn instead of polling get_turn
+            turns.wait(side)
+            if turns.finished:
+                break
+
         print(f"\n--- Turn {turn + 1} ---")
 
-        response = client.chat.completions.create(
-            model="gpt-4",
+        # Show the model the current board directly instead of via a tool call
+        state = state_prompt(_MCP, side)
+        if _MCP.game_over:
+            # The opponent finished the game; no need for another LLM round trip
+            print("\n🏁 Game over!")
+            break
+        if state_message is not None:
+            messages.remove(state_message)
+        state_message = {"role": "user", "content": state}
+        messages.append(state_message)
+
+        stream = client.chat.completions.create(
+            model="gpt-4o",
             messages=messages,
-            functions=functions,
-            function_call="auto"
+            tools=TOOLS,
+            tool_choice="auto",
+            parallel_tool_calls=True,
+            stream=True
         )
 
-        message = response.choices[0].message
-
-        # Check if the model wants to call a function
-        if message.function_call:
-            function_name = message.function_call.name
-            arguments = json.loads(message.function_call.arguments)
-
-            # Execute the function
-            result = execute_function(function_name, arguments)
-
-            # Add function call and result to messages
+        content = ""
+        tool_calls = []
+        futures = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content += delta.content
+
+            for tool_call in delta.tool_calls or []:
+                if tool_call.index == len(tool_calls):
+                    # A new call has started, so the previous one is complete
+                    if tool_calls:
+                        futures.append(dispatch_tool_call(tool_calls))
+                    tool_calls.append({
+                        "id": tool_call.id,
+                        "type": "function",
+                        "function": {"name": tool_call.function.name, "arguments": ""}
+                    })
+                if tool_call.function and tool_call.function.arguments:
+                    tool_calls[tool_call.index]["function"]["arguments"] += tool_call.function.arguments
+
+        # Check if the model wants to call tools
+        if tool_calls:
+            # The last call is complete once the stream ends
+            futures.append(dispatch_tool_call(tool_calls))
+            results = [future.result() for future in futures]
+
+            # Add the tool calls and one result message per call
             messages.append({
                 "role": "assistant",
-                "content": None,
-                "function_call": {
-                    "name": function_name,
-                    "arguments": message.function_call.arguments
-                }
-            })
-            messages.append({
-                "role": "function",
-                "name": function_name,
-                "content": json.dumps(result)
+                "content": content or None,
+                "tool_calls": tool_calls
             })
+            for tool_call, result in zip(tool_calls, results):
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call["id"],
+                    "content": msgspec.json.encode(result).decode()
+                })
+
+            if _MCP.game_over:
+                print("\n🏁 Game over!")
+                break
+
+            # A successful move passes the turn to the opponent
+            moved = any(
+                tc["function"]["name"] == "make_move" and result.get("success")
+                for tc, result in zip(tool_calls, results)
+            )
+            if turns is not None and moved:
+                turns.hand_over(side)
 
         else:
             # Model responded with text
-            print(f"\n💬 GPT-4 says: {message.content}")
-            messages.append({"role": "assistant", "content": message.content})
-            break
+            print(f"\n💬 GPT-4o says: {content}")
+            messages.append({"role": "assistant", "content": content})
+            if side is None:
+                break
+
+            # Head-to-head games go on until the server reports the end
+            messages.append({"role": "user", "content": "Continue playing."})
 
     print("\n" + "=" * 60)
     print("🎮 Game session complete!")
@@ -0,0 +1,57 @@
+"""
+Tests for the shared minimax solver and board prompt.
+"""
+
+import pytest
+
+from _game import compact_state, minimax, state_prompt
+
+@pytest.mark.parametrize("board, player, expected", [
+    # O wins at once on the middle row; blocking X's top row at 2 is slower
+    ("XX.OO....", "O", (5, (5,))),
+    # X wins at once on the top row
+    ("XX.OO....", "X", (5, (2,))),
+    # O must block at 2; X then forks, but every other move loses sooner
+    ("XX.O.....", "O", (-3, (2,))),
+    # Against a corner opening only the centre holds the draw
+    ("X........", "O", (0, (4,))),
+    # Every opening move draws under perfect play
+    (".........", "X", (0, tuple(range(9)))),
+])
+def test_minimax_known_positions(board, player, expected):
+    assert minimax(board, player) == expected
+
+def test_minimax_finished_boards():
+    assert minimax("XXXOO....", "O") == (-5, ())
+    assert minimax("XOXXOOOXX", "X") == (0, ())
+
+class StubClient:
+    def __init__(self, state):
+        self.state = state
+
+    def call(self, method, params=None):
+        assert method == "view_game_state"
+        return self.state
+
+def state(board, current_turn, ai_player="O", status="InProgress"):
+    cells = [{"Occupied": c} if c != "." else "Empty" for c in board]
+    return {
+        "board": [cells[0:3], cells[3:6], cells[6:9]],
+        "currentTurn": current_turn,
+        "aiPlayer": ai_player,
+        "status": status,
+    }
+
+def test_compact_state():
+    assert compact_state(state("X...O....", "X")) == "board=X...O.... turn=X status=InProgress ai=O"
+
+def test_state_prompt_offers_optimal_moves_on_our_turn():
+    prompt = state_prompt(StubClient(state("XX.OO....", "O")))
+    assert prompt == (
+        "Current board:\nboard=XX.OO.... turn=O status=InProgress ai=O\n"
+        "Choose one of these equally strong moves: (row 1, col 2). Play it with make_move, then taunt."
+    )
+
+def test_state_prompt_has_no_moves_on_opponent_turn():
+    prompt = state_prompt(StubClient(state("XX.OO....", "X")), side="O")
+    assert "Choose" not in prompt
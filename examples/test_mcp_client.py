@@ -0,0 +1,183 @@
+"""
+Tests for the shared MCP client: read cache, batching and error slots.
+
+The urllib3 pool is replaced by a fake, so no MCP server is needed:
+    pip install pytest urllib3 msgspec
+    python3 -m pytest examples
+"""
+
+import json
+import types
+import uuid
+
+import pytest
+
+from _mcp_client import MCPClient, MCPError
+
+EMPTY_BOARD = [["Empty"] * 3 for _ in range(3)]
+
+def view_result(current_turn="O", ai_player="O", status="InProgress"):
+    return {
+        "board": EMPTY_BOARD,
+        "currentTurn": current_turn,
+        "aiPlayer": ai_player,
+        "status": status,
+    }
+
+class FakePool:
+    """Stands in for the urllib3 pool: records each request and answers it with ``handler``."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def urlopen(self, method, path, body, headers):
+        request = json.loads(body)
+        self.requests.append(request)
+        if isinstance(request, list):
+            response = [self.handler(r) for r in request]
+        else:
+            response = self.handler(request)
+        return types.SimpleNamespace(status=200, data=json.dumps(response).encode())
+
+    def methods(self):
+        """Methods that reached the server, with batches flattened."""
+        return [
+            r["method"]
+            for request in self.requests
+            for r in (request if isinstance(request, list) else [request])
+        ]
+
+def reply(results):
+    """Build a handler answering each method with ``results[method]``."""
+    def handler(request):
+        return {"jsonrpc": "2.0", "id": request["id"], "result": results[request["method"]]}
+    return handler
+
+def make_client(handler):
+    # MCPClient keeps one instance per URL, so each test gets a URL of its own
+    client = MCPClient(f"http://localhost:7397/mcp-{uuid.uuid4()}")
+    client._http = FakePool(handler)
+    return client
+
+@pytest.fixture
+def results():
+    return {
+        "view_game_state": view_result(),
+        "get_turn": {"currentTurn": "O", "isAiTurn": True, "isHumanTurn": False},
+        "make_move": {"success": True, "gameState": {"status": "InProgress"}},
+        "restart_game": {"success": True},
+        "taunt_player": {"success": True},
+    }
+
+def test_one_instance_per_url():
+    url = f"http://localhost:7397/mcp-{uuid.uuid4()}"
+    assert MCPClient(url) is MCPClient(url)
+
+def test_read_on_ai_turn_is_cached(results):
+    client = make_client(reply(results))
+    client.call("view_game_state")
+    client.call("view_game_state")
+    assert client._http.methods() == ["view_game_state"]
+
+@pytest.mark.parametrize("write", ["make_move", "restart_game", "taunt_player"])
+def test_write_invalidates_cache(results, write):
+    client = make_client(reply(results))
+    client.call("view_game_state")
+    client.call(write, {"row": 0, "col": 0} if write == "make_move" else None)
+    client.call("view_game_state")
+    assert client._http.methods() == ["view_game_state", write, "view_game_state"]
+
+@pytest.mark.parametrize("method, result", [
+    ("view_game_state", view_result(current_turn="X")),
+    ("view_game_state", view_result(status="Won_X")),
+    ("view_game_state", view_result(status="Draw")),
+    ("get_turn", {"currentTurn": "X", "isAiTurn": False, "isHumanTurn": True}),
+])
+def test_read_not_cached_on_human_turn_or_finished_game(results, method, result):
+    results[method] = result
+    client = make_client(reply(results))
+    client.call(method)
+    client.call(method)
+    assert client._http.methods() == [method, method]
+
+def test_batch_read_after_write_goes_to_server(results):
+    client = make_client(reply(results))
+    client.call("view_game_state")
+    client.batch([("taunt_player", {"message": "hi"}), ("view_game_state", None)])
+    assert client._http.requests[-1] == [
+        {"jsonrpc": "2.0", "method": "taunt_player", "params": {"message": "hi"}, "id": 0},
+        {"jsonrpc": "2.0", "method": "view_game_state", "params": {}, "id": 1},
+    ]
+
+def test_batch_read_before_write_is_not_cached(results):
+    client = make_client(reply(results))
+    client.batch([("view_game_state", None), ("taunt_player", {"message": "hi"})])
+    client.call("view_game_state")
+    assert client._http.methods() == ["view_game_state", "taunt_player", "view_game_state"]
+
+def test_batch_serves_cached_reads_locally(results):
+    client = make_client(reply(results))
+    client.call("get_turn")
+    assert client.batch([("get_turn", None), ("view_game_state", None)]) == [
+        results["get_turn"],
+        results["view_game_state"],
+    ]
+    assert client._http.requests[-1] == [
+        {"jsonrpc": "2.0", "method": "view_game_state", "params": {}, "id": 0},
+    ]
+
+def test_batch_restores_call_order(results):
+    client = make_client(reply(results))
+    real_urlopen = client._http.urlopen
+
+    def reversed_urlopen(method, path, body, headers):
+        response = real_urlopen(method, path, body, headers)
+        response.data = json.dumps(json.loads(response.data)[::-1]).encode()
+        return response
+
+    client._http.urlopen = reversed_urlopen
+    calls = [("make_move", {"row": 1, "col": 1}), ("taunt_player", {"message": "hi"}), ("get_turn", None)]
+    assert client.batch(calls) == [results["make_move"], results["taunt_player"], results["get_turn"]]
+
+def test_batch_puts_rejected_call_in_its_slot(results):
+    def handler(request):
+        if request["method"] == "make_move":
+            error = {"code": -32603, "message": "Cell already occupied"}
+            return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+        return reply(results)(request)
+
+    client = make_client(handler)
+    made, taunted = client.batch([("make_move", {"row": 0, "col": 0}), ("taunt_player", {"message": "hi"})])
+    assert isinstance(made, MCPError)
+    assert "Cell already occupied" in str(made)
+    assert taunted == results["taunt_player"]
+
+def test_batch_unparseable_element_raises():
+    def handler(request):
+        return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+    client = make_client(handler)
+    with pytest.raises(MCPError, match="Invalid Request"):
+        client.batch([("get_turn", None), ("view_game_state", None)])
+
+def test_call_error_raises_mcp_error():
+    def handler(request):
+        return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32603, "message": "Game is already over"}}
+
+    client = make_client(handler)
+    with pytest.raises(MCPError, match="Game is already over"):
+        client.call("make_move", {"row": 0, "col": 0})
+
+def test_game_over_tracking(results):
+    client = make_client(reply(results))
+    results["make_move"] = {"success": True, "gameState": {"status": "Won_O"}}
+    client.call("make_move", {"row": 0, "col": 0})
+    assert client.game_over
+
+    client.call("restart_game")
+    assert not client.game_over
+
+    results["view_game_state"] = view_result(status="Won_X")
+    client.call("view_game_state")
+    assert client.game_over
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Head-to-head tic-tac-toe: the OpenAI agent plays X and the Gemini agent plays O,
+both talking to the same MCP HTTP server.
+
+Usage:
+    export OPENAI_API_KEY="your-openai-key"
+    export GOOGLE_API_KEY="your-google-key"
+    python3 examples/vs.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import os
+
+import gemini_agent
+import openai_agent
+from _mcp_client import MCPClient
+
+class TurnSignal:
+    """Wakes the agent whose turn it is so the idle one blocks instead of polling."""
+
+    def __init__(self, first_side):
+        self._events = {"X": threading.Event(), "O": threading.Event()}
+        self._events[first_side].set()
+        self.finished = False
+
+    def wait(self, side):
+        """Block until it is ``side``'s move or the match has finished."""
+        self._events[side].wait()
+
+    def hand_over(self, side):
+        """Pass the turn from ``side`` to its opponent."""
+        self._events[side].clear()
+        self._events["O" if side == "X" else "X"].set()
+
+    def finish(self):
+        """End the match and release whichever agent is still waiting."""
+        self.finished = True
+        for event in self._events.values():
+            event.set()
+
+def play(run_agent, side, turns):
+    """Run one agent, ending the match for both sides when it stops."""
+    try:
+        run_agent(side=side, turns=turns)
+    finally:
+        turns.finish()
+
+def main():
+    """Run the OpenAI (X) and Gemini (O) agents against each other."""
+    # MCPClient has one instance per URL, so both agents already share it
+    mcp = MCPClient(openai_agent.MCP_URL)
+
+    mcp.call("restart_game")
+    first_side = mcp.call("get_turn")["currentTurn"]
+    turns = TurnSignal(first_side)
+
+    print(f"🤖 OpenAI (X) vs Gemini (O) - {first_side} goes first")
+    print("=" * 60)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(play, openai_agent.run_agent, "X", turns),
+            executor.submit(play, gemini_agent.run_agent, "O", turns),
+        ]
+        for future in futures:
+            future.result()
+
+if __name__ == "__main__":
+    missing = [key for key in ("OPENAI_API_KEY", "GOOGLE_API_KEY") if not os.environ.get(key)]
+    if missing:
+        print(f"❌ Error: {', '.join(missing)} not set")
+        print("Usage: export OPENAI_API_KEY='...' GOOGLE_API_KEY='...' && python3 examples/vs.py")
+        exit(1)
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n👋 Game interrupted by user")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")